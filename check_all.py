@@ -0,0 +1,47 @@
+
+from sqlalchemy import text
+from db import get_conn
+
+# check_jan_values / check_roas / check_values_detailed 三个窗口的汇总合并为一次扫描 (条件聚合)
+WINDOWS = {
+    "Value Check (Jan 1 - Jan 9)": (
+        "day_time BETWEEN '2026-01-01' AND '2026-01-09'",
+        ['cost', 'all_conversion_value', 'conversions_value'],
+    ),
+    "Metric Comparison (Last 5 days)": (
+        "day_time >= DATE_SUB(CURDATE(), INTERVAL 5 DAY)",
+        ['cost', 'all_conversion_value', 'conversions_value', 'view_through_conversions'],
+    ),
+    "Detailed Value Comparison (Last 30 days)": (
+        "day_time >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)",
+        ['cost', 'all_conversion_value', 'conversions_value',
+         'conversions_value_by_conversion_date', 'current_model_attributed_conversion_value'],
+    ),
+}
+
+try:
+    with get_conn() as conn:
+        select_cols = []
+        for i, (cond, metrics) in enumerate(WINDOWS.values()):
+            for m in metrics:
+                select_cols.append(f"SUM(CASE WHEN {cond} THEN {m} END) AS w{i}_{m}")
+        # 只扫描落在任一窗口内的行
+        where = " OR ".join(f"({cond})" for cond, _ in WINDOWS.values())
+        query = f"SELECT {', '.join(select_cols)} FROM t_google_cost WHERE {where}"
+        totals = conn.execute(text(query)).mappings().one()
+
+        for i, (title, (_, metrics)) in enumerate(WINDOWS.items()):
+            print(f"\n--- {title} ---")
+            for m in metrics:
+                print(f"{m}: {totals[f'w{i}_{m}']}")
+
+            cost = totals[f"w{i}_cost"]
+            if cost:
+                # 分子 SUM 可能为 NULL (窗口内该列全为空)，逐个判空后再除
+                for m, label in [('all_conversion_value', 'All Conv Value'), ('conversions_value', 'Std Conv Value')]:
+                    value = totals[f"w{i}_{m}"]
+                    if value is not None:
+                        print(f"ROAS ({label}): {value / cost:.4f}")
+
+except Exception as e:
+    print(f"Error: {e}")
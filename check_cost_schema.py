@@ -1,20 +1,11 @@
 
-import toml
-import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from db import get_conn
 
 try:
-    secrets = toml.load("Ads_BI/.streamlit/secrets.toml")
-    db_config = secrets["connections"]["mysql"]
-    connection_str = f"mysql+pymysql://{db_config['username']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
-    engine = create_engine(connection_str)
-    conn = engine.connect()
-
-    print("--- t_google_cost columns ---")
-    res = conn.execute(text("DESCRIBE t_google_cost"))
-    for row in res:
-        print(row[0])
-        
-    conn.close()
+    with get_conn() as conn:
+        print("--- t_google_cost columns ---")
+        rows = conn.execute(text("DESCRIBE t_google_cost")).fetchall()
+        print("\n".join(row[0] for row in rows))
 except Exception as e:
     print(e)
@@ -1,34 +1,64 @@
 
-import toml
-import pandas as pd
-from sqlalchemy import create_engine, text
-import os
+from sqlalchemy import text, bindparam
+from db import get_conn
+
+
+def check_table(conn, t, has_day_time=True):
+    """单表逐条查询 (合并查询失败时的回退路径，保留逐表报错)"""
+    try:
+        res = conn.execute(text(f"SELECT COUNT(*) FROM {t}"))
+        count = res.scalar()
+        print(f"Table {t}: {count} rows")
+
+        if not has_day_time:
+            print(f"   Error checking {t}: no day_time column")
+        elif count > 0:
+            res = conn.execute(text(f"SELECT MAX(day_time) FROM {t}"))
+            max_date = res.scalar()
+            print(f"   Latest Date: {max_date}")
+    except Exception as e:
+        print(f"   Error checking {t}: {e}")
+
 
 try:
-    secrets_path = "Ads_BI/.streamlit/secrets.toml"
-    secrets = toml.load(secrets_path)
-    db_config = secrets["connections"]["mysql"]
-    
-    connection_str = f"mysql+pymysql://{db_config['username']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
-    engine = create_engine(connection_str)
-    conn = engine.connect()
-
-    tables = ['t_google_ad_cost', 't_google_cost', 't_google_cost_20220321', 't_google_cost_20220406', 't_google_keyword_cost']
-    
-    for t in tables:
-        try:
-            res = conn.execute(text(f"SELECT COUNT(*) FROM {t}"))
-            count = res.scalar()
-            print(f"Table {t}: {count} rows")
-            
-            if count > 0:
-                res = conn.execute(text(f"SELECT MAX(day_time) FROM {t}"))
-                max_date = res.scalar()
-                print(f"   Latest Date: {max_date}")
-        except Exception as e:
-            print(f"   Error checking {t}: {e}")
-
-    conn.close()
+    with get_conn() as conn:
+        tables = ['t_google_ad_cost', 't_google_cost', 't_google_cost_20220321', 't_google_cost_20220406', 't_google_keyword_cost']
+
+        # 1 次查询确认哪些表存在、是否有 day_time 列 (UNION ALL 要求所有表、列都存在)
+        exist_query = text("""
+            SELECT t.TABLE_NAME, COUNT(c.COLUMN_NAME) AS has_day_time
+            FROM information_schema.TABLES t
+            LEFT JOIN information_schema.COLUMNS c
+              ON c.TABLE_SCHEMA = t.TABLE_SCHEMA AND c.TABLE_NAME = t.TABLE_NAME AND c.COLUMN_NAME = 'day_time'
+            WHERE t.TABLE_SCHEMA = DATABASE() AND t.TABLE_NAME IN :tables
+            GROUP BY t.TABLE_NAME
+        """).bindparams(bindparam("tables", expanding=True))
+        has_day_time = {name: bool(flag) for name, flag in conn.execute(exist_query, {"tables": tables})}
+        for t in tables:
+            if t not in has_day_time:
+                print(f"   Error checking {t}: table does not exist")
+        tables = [t for t in tables if t in has_day_time]
+
+        if tables:
+            # 行数与最新日期合并为 1 次往返；无 day_time 列的表只统计行数
+            union_sql = "\nUNION ALL\n".join(
+                f"SELECT '{t}' AS tbl, COUNT(*) AS cnt, {'MAX(day_time)' if has_day_time[t] else 'NULL'} AS max_dt FROM {t}"
+                for t in tables
+            )
+            try:
+                results = conn.execute(text(union_sql)).fetchall()
+            except Exception as e:
+                # 合并查询失败 (如某张表无权限)：逐表查询，单表出错不影响其它表
+                print(f"Combined query failed ({e}), checking tables one by one...")
+                for t in tables:
+                    check_table(conn, t, has_day_time[t])
+            else:
+                for t, count, max_date in results:
+                    print(f"Table {t}: {count} rows")
+                    if not has_day_time[t]:
+                        print(f"   Error checking {t}: no day_time column")
+                    elif count > 0:
+                        print(f"   Latest Date: {max_date}")
 
 except Exception as e:
     print(f"Error: {e}")
@@ -1,31 +1,38 @@
 
-import toml
-import pandas as pd
-from sqlalchemy import create_engine, text
+from itertools import groupby
+from sqlalchemy import text, bindparam
+from db import get_conn
 
 try:
-    secrets_path = "Ads_BI/.streamlit/secrets.toml"
-    secrets = toml.load(secrets_path)
-    db_config = secrets["connections"]["mysql"]
-    connection_str = f"mysql+pymysql://{db_config['username']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
-    engine = create_engine(connection_str)
-    conn = engine.connect()
+    with get_conn() as conn:
+        tables = ['t_google_variant', 't_google_product_cost', 't_fb_adset']
 
-    for t in ['t_google_variant', 't_google_product_cost', 't_fb_adset']:
-        print(f"\n--- Schema for {t} ---")
-        try:
-             res = conn.execute(text(f"DESCRIBE {t}"))
-             for row in res:
-                 print(f"{row[0]}: {row[1]}")
-             
-             # Check distinct Count
-             cnt = conn.execute(text(f"SELECT COUNT(*) FROM {t}")).scalar()
-             print(f"Row count: {cnt}")
+        # 所有表的字段一次取回 (代替逐表 DESCRIBE)
+        columns_query = text("""
+            SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :tables
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """).bindparams(bindparam("tables", expanding=True))
+        schema = {
+            t: [(name, col_type) for _, name, col_type in rows]
+            for t, rows in groupby(conn.execute(columns_query, {"tables": tables}), key=lambda r: r[0])
+        }
 
-        except Exception as e:
-            print(f"Error: {e}")
+        # 行数取 information_schema 估算值 (InnoDB 为近似值，无需全表 COUNT(*))
+        rows_query = text("""
+            SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :tables
+        """).bindparams(bindparam("tables", expanding=True))
+        row_counts = dict(conn.execute(rows_query, {"tables": tables}).fetchall())
 
-    conn.close()
+        for t in tables:
+            print(f"\n--- Schema for {t} ---")
+            if t not in schema:
+                print(f"Error: table {t} does not exist")
+                continue
+            for name, col_type in schema[t]:
+                print(f"{name}: {col_type}")
+            print(f"Row count (approx): {row_counts.get(t)}")
 
 except Exception as e:
     print(f"Error: {e}")
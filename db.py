@@ -0,0 +1,38 @@
+
+import os
+import toml
+from contextlib import contextmanager
+from functools import lru_cache
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+# 调试脚本共用的 MySQL 连接 (与 Streamlit 应用读取同一份 secrets)
+SECRETS_PATH = "Ads_BI/.streamlit/secrets.toml"
+
+
+def load_db_config():
+    """读取 secrets.toml 中的 [connections.mysql] 配置"""
+    return toml.load(SECRETS_PATH)["connections"]["mysql"]
+
+
+def connection_url(db_config):
+    return f"mysql+pymysql://{db_config['username']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """
+    进程内只解析一次配置、创建一个 Engine。
+    默认带连接池；一次性脚本可设置 ADS_POOL=nullpool，用完即关闭连接，不保留空闲 socket。
+    """
+    url = connection_url(load_db_config())
+    if os.environ.get("ADS_POOL", "queue").lower() == "nullpool":
+        return create_engine(url, poolclass=NullPool)
+    return create_engine(url, pool_pre_ping=True, pool_recycle=1800)
+
+
+@contextmanager
+def get_conn():
+    """从连接池取连接，退出 with 时归还"""
+    with get_engine().connect() as conn:
+        yield conn
@@ -3,12 +3,12 @@ import pandas as pd
 
 file_path = "/Users/yixinyue/Desktop/广告看板制作/mapping.xlsx"
 try:
-    xl = pd.ExcelFile(file_path)
+    xl = pd.ExcelFile(file_path, engine="calamine")
     print(f"Sheet names: {xl.sheet_names}")
     
     for sheet in xl.sheet_names:
         print(f"\n--- Sheet: {sheet} (First 5 rows) ---")
-        df = xl.parse(sheet)
+        df = xl.parse(sheet, nrows=5)  # 只预览前 5 行，无需解析整张表
         print(df.head().to_string())
         print(f"Columns: {list(df.columns)}")
         
@@ -3,14 +3,14 @@ import pandas as pd
 
 excel_path = "Ads_BI/mapping.xlsx"
 try:
-    xls = pd.ExcelFile(excel_path)
+    xls = pd.ExcelFile(excel_path, engine="calamine")
     print(f"Sheet names: {xls.sheet_names}")
     
     for sheet in xls.sheet_names:
         # Check if this is the new sheet user mentioned
         if "mapping" in sheet.lower():
             print(f"\n--- Sheet: {sheet} (First 5 rows) ---")
-            df = xls.parse(sheet)
+            df = xls.parse(sheet, nrows=5)  # 只预览前 5 行，无需解析整张表
             print(df.head().to_string())
             print(f"Columns: {list(df.columns)}")
             